@@ -7,10 +7,10 @@ Extracts from the original names.csv and formats properly for Notion import
 import sys
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add src/ to path so the package imports under its canonical name
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from src.aysekai.utils import constants, content, parser, csv_handler, validators
+from aysekai.utils import constants, content, parser, csv_handler, validators
 
 
 def extract_names_from_original(input_file: Path):
@@ -7,10 +7,10 @@ Parse the data intelligently and exclude the 5 already in Notion
 import sys
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add src/ to path so the package imports under its canonical name
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from src.aysekai.utils import constants, content, parser, csv_handler, validators
+from aysekai.utils import constants, content, parser, csv_handler, validators
 
 
 def parse_names_from_csv(input_file: Path):
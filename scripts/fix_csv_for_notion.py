@@ -7,10 +7,10 @@ Addresses issues with multi-line content in Ta'wil column being truncated
 import sys
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add src/ to path so the package imports under its canonical name
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from src.aysekai.utils import constants, content, csv_handler, validators
+from aysekai.utils import constants, content, csv_handler, validators
 
 
 def fix_csv_for_notion(input_file: Path, output_file: Path):
@@ -7,7 +7,23 @@ from typing import Optional
 @dataclass
 class DivineName:
     """Represents one of the 99 Beautiful Names of Allah"""
-    
+
+    # Fixed slots: 99 instances per load plus test fixtures, all with
+    # the same 11 fields — no per-instance __dict__ needed
+    __slots__ = (
+        "number",
+        "arabic",
+        "transliteration",
+        "brief_meaning",
+        "level_1_sharia",
+        "level_2_tariqa",
+        "level_3_haqiqa",
+        "level_4_marifa",
+        "quranic_references",
+        "dhikr_formulas",
+        "pronunciation_guide",
+    )
+
     number: int
     arabic: str
     transliteration: str
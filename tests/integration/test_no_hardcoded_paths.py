@@ -1,18 +1,31 @@
 import pytest
 import ast
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+@pytest.fixture(scope="module")
+def python_file_contents():
+    """Read all project source files once, in parallel.
+
+    Path.read_text releases the GIL during the underlying syscalls, so a
+    thread pool overlaps the file reads instead of paying for them serially
+    (and once per test).
+    """
+    src_dir = Path(__file__).parent.parent.parent / "src"
+    paths = list(src_dir.rglob("*.py"))
+
+    with ThreadPoolExecutor() as executor:
+        contents = list(executor.map(lambda p: (p, p.read_text(errors="replace")), paths))
+
+    return contents
+
+
 class TestNoHardcodedPaths:
     """Integration tests to ensure no hardcoded paths exist"""
-    
-    def get_python_files(self):
-        """Get all Python files in the project"""
-        src_dir = Path(__file__).parent.parent.parent / "src"
-        return list(src_dir.rglob("*.py"))
-    
-    def test_no_hardcoded_home_paths(self):
+
+    def test_no_hardcoded_home_paths(self, python_file_contents):
         """Test no hardcoded home directory paths"""
         forbidden_patterns = [
             r"Path\.home\(\)\s*/\s*[\"']Library",
@@ -22,19 +35,17 @@ class TestNoHardcodedPaths:
             r"Mobile Documents",
             r"Manual Library",
         ]
-        
+
         pattern = re.compile("|".join(forbidden_patterns))
-        
+
         violations = []
-        for py_file in self.get_python_files():
-            with open(py_file, 'r') as f:
-                content = f.read()
-                if pattern.search(content):
-                    violations.append(py_file)
-        
+        for py_file, content in python_file_contents:
+            if pattern.search(content):
+                violations.append(py_file)
+
         assert len(violations) == 0, f"Hardcoded paths found in: {violations}"
-    
-    def test_path_construction_uses_config(self):
+
+    def test_path_construction_uses_config(self, python_file_contents):
         """Test all path construction uses configuration"""
         required_imports = [
             "from aysekai.config import get_settings",
@@ -42,33 +53,30 @@ class TestNoHardcodedPaths:
             "from aysekai.cli.path_resolver import PathResolver",
             "from ..cli.path_resolver import PathResolver",  # Relative import
         ]
-        
+
         files_using_paths = []
-        for py_file in self.get_python_files():
-            with open(py_file, 'r') as f:
-                content = f.read()
-                
-                # Skip test files, config, validators, and secure_logger (takes paths as params)
-                skip_files = ["settings.py", "validators.py", "secure_logger.py", "path_resolver.py"]
-                if "test_" in py_file.name or py_file.name in skip_files:
-                    continue
-                
-                # Check if file constructs absolute paths (not relative)
-                hardcoded_patterns = [
-                    r'Path\s*\(\s*["\'][^"\']*[/\\]',  # Path("/absolute/path") or Path("C:\\path")
-                    r'["\'][/\\][^"\']*["\']',         # "/absolute/path" or "\\absolute\\path"
-                ]
-                
-                has_hardcoded = False
-                for pattern in hardcoded_patterns:
-                    if re.search(pattern, content):
-                        has_hardcoded = True
-                        break
-                
-                if has_hardcoded:
-                    files_using_paths.append((py_file, content))
-        
+        for py_file, content in python_file_contents:
+            # Skip test files, config, validators, and secure_logger (takes paths as params)
+            skip_files = ["settings.py", "validators.py", "secure_logger.py", "path_resolver.py"]
+            if "test_" in py_file.name or py_file.name in skip_files:
+                continue
+
+            # Check if file constructs absolute paths (not relative)
+            hardcoded_patterns = [
+                r'Path\s*\(\s*["\'][^"\']*[/\\]',  # Path("/absolute/path") or Path("C:\\path")
+                r'["\'][/\\][^"\']*["\']',         # "/absolute/path" or "\\absolute\\path"
+            ]
+
+            has_hardcoded = False
+            for pattern in hardcoded_patterns:
+                if re.search(pattern, content):
+                    has_hardcoded = True
+                    break
+
+            if has_hardcoded:
+                files_using_paths.append((py_file, content))
+
         # Verify files using paths import configuration
         for py_file, content in files_using_paths:
             has_config = any(imp in content for imp in required_imports)
-            assert has_config, f"{py_file} constructs paths without config import"
\ No newline at end of file
+            assert has_config, f"{py_file} constructs paths without config import"
@@ -1,41 +1,34 @@
 import pytest
+import re
 import subprocess
 import sys
 from pathlib import Path
 
+# Single compiled pattern covering all old import forms; scanning bytes
+# avoids decoding every file and skips binary-file error handling
+_OLD_IMPORTS = re.compile(rb"(?:from|import)\s+asma(?:_al_husna_cli|_core)\b")
+
 
 class TestPackageMigration:
     """Integration tests for package migration"""
-    
+
     def test_old_imports_removed_globally(self):
         """Test no files in project use old import patterns"""
         root = Path(__file__).parent.parent.parent
-        
-        old_import_patterns = [
-            "from asma_al_husna_cli",
-            "import asma_al_husna_cli", 
-            "from asma_core",
-            "import asma_core",
-        ]
-        
+
         # Search all Python files
         python_files = list(root.rglob("*.py"))
         violations = []
-        
+
         for py_file in python_files:
             # Skip test files that might reference old imports
             if "test_package" in str(py_file):
                 continue
-                
-            try:
-                content = py_file.read_text()
-                for pattern in old_import_patterns:
-                    if pattern in content:
-                        violations.append((py_file, pattern))
-            except UnicodeDecodeError:
-                # Skip binary files
-                continue
-        
+
+            match = _OLD_IMPORTS.search(py_file.read_bytes())
+            if match:
+                violations.append((py_file, match.group().decode()))
+
         assert len(violations) == 0, f"Old imports found: {violations}"
     
     def test_cli_still_works(self):
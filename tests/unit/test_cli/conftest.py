@@ -0,0 +1,32 @@
+"""Shared fixtures for CLI tests"""
+
+import pytest
+from io import StringIO
+from rich.console import Console
+
+
+@pytest.fixture(scope="package")
+def console_factory():
+    """Factory for capture consoles, sharing one set of console options.
+
+    Terminal/color detection happens when the factory is first built, not
+    once per test; each call still binds a fresh StringIO so output stays
+    isolated per test.
+    """
+    def make_console():
+        # No force_terminal: the assertions check plain substrings, so
+        # skipping ANSI style emission keeps getvalue() free of escape
+        # codes. highlight=False skips the ReprHighlighter regex pass on
+        # every write. Markup stays on because the handlers print
+        # [yellow]...[/yellow] style strings. width=200 keeps long tmp
+        # paths (which grow a popen-gwN segment under xdist) from
+        # wrapping mid-filename and breaking substring assertions.
+        return Console(file=StringIO(), width=200, highlight=False)
+
+    return make_console
+
+
+@pytest.fixture
+def mock_console(console_factory):
+    """Create mock console for testing output"""
+    return console_factory()
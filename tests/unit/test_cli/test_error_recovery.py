@@ -5,11 +5,17 @@ from aysekai.core.exceptions import DataError, ValidationError
 
 class TestErrorRecovery:
     """Test error recovery mechanisms"""
-    
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        """Make retry delays instant — the tests exercise the retry logic,
+        not the wall clock"""
+        monkeypatch.setattr("aysekai.cli.error_handler.time.sleep", lambda *_: None)
+
     def test_retry_on_transient_error(self):
         """Test retry logic for transient errors"""
         attempt_count = 0
-        
+
         @with_retry(max_attempts=3, delay=0.01)
         def flaky_function():
             nonlocal attempt_count
@@ -1,22 +1,36 @@
 import pytest
 from pathlib import Path
 from aysekai.cli.secure_logger import SecureSessionLogger
-from aysekai.config import get_settings
+from aysekai.config import get_settings, reset_settings
 
 
 class TestLoggerIntegration:
     """Test logger integration with application"""
-    
-    def test_logger_uses_config_settings(self, tmp_path, monkeypatch):
-        """Test logger respects configuration settings"""
-        # Set config to use encryption
+
+    @pytest.fixture
+    def logger(self, tmp_path):
+        """Logger writing under tmp_path, with the log dir already made"""
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        return SecureSessionLogger(log_dir)
+
+    @pytest.fixture
+    def fresh_settings(self, tmp_path, monkeypatch):
+        """Settings reloaded once with encryption enabled, reset on teardown.
+
+        monkeypatch restores the env vars automatically; the trailing
+        reset keeps the settings singleton from leaking into later tests.
+        """
         monkeypatch.setenv("AYSEKAI_SESSION_LOG_ENCRYPTION", "true")
         monkeypatch.setenv("AYSEKAI_DATA_DIR", str(tmp_path))
-        
-        from aysekai.config import reset_settings
+
         reset_settings()  # Force reload
-        
-        settings = get_settings()
+        yield get_settings()
+        reset_settings()
+
+    def test_logger_uses_config_settings(self, fresh_settings):
+        """Test logger respects configuration settings"""
+        settings = fresh_settings
         log_dir = settings.data_dir / "logs"
         log_dir.mkdir(parents=True)
         
@@ -25,13 +39,8 @@ class TestLoggerIntegration:
         
         assert logger.encrypt is True
     
-    def test_logger_in_meditation_flow(self, tmp_path):
+    def test_logger_in_meditation_flow(self, logger):
         """Test logger in actual meditation workflow"""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        
-        logger = SecureSessionLogger(log_dir)
-        
         # Simulate meditation session
         from aysekai.utils.validators import InputValidator
         
@@ -7,7 +7,18 @@ from aysekai.config.settings import Settings, get_settings
 
 class TestSettings:
     """Test configuration management"""
-    
+
+    @pytest.fixture(autouse=True)
+    def no_dotenv(self, monkeypatch):
+        """Skip the .env lookup every Settings() does by default.
+
+        None of these tests rely on an ambient .env file — the one that
+        exercises env-file loading passes _env_file explicitly, which
+        overrides this — so the per-construction stat is pure overhead
+        (and a stray .env in the CWD could skew assertions).
+        """
+        monkeypatch.setitem(Settings.model_config, "env_file", None)
+
     def test_default_settings(self):
         """Test default settings initialization"""
         settings = Settings()
@@ -42,19 +53,24 @@ class TestSettings:
         
         assert "Invalid data directory" in str(exc_info.value)
     
-    def test_max_prompt_length_validation(self):
+    @pytest.mark.parametrize(
+        "value,valid",
+        [
+            (0, False),  # too small
+            (1001, False),  # too large
+            (750, True),
+        ],
+    )
+    def test_max_prompt_length_validation(self, value, valid):
         """Test prompt length constraints"""
-        # Too small
-        with pytest.raises(ValidationError):
-            Settings(max_prompt_length=0)
-        
-        # Too large
-        with pytest.raises(ValidationError):
-            Settings(max_prompt_length=1001)
-        
-        # Valid range
-        settings = Settings(max_prompt_length=750)
-        assert settings.max_prompt_length == 750
+        # _env_file=None skips the .env stat; these cases only exercise
+        # the field constraint
+        if valid:
+            settings = Settings(max_prompt_length=value, _env_file=None)
+            assert settings.max_prompt_length == value
+        else:
+            with pytest.raises(ValidationError):
+                Settings(max_prompt_length=value, _env_file=None)
     
     def test_singleton_pattern(self):
         """Test get_settings returns singleton"""
@@ -0,0 +1,39 @@
+"""Tests for aysekai.core.exceptions module"""
+
+import pytest
+
+from aysekai.core.exceptions import (
+    AysekaiError,
+    ValidationError,
+    DataError,
+    ConfigurationError,
+)
+
+
+@pytest.mark.parametrize(
+    "exc_cls",
+    [ValidationError, DataError, ConfigurationError],
+)
+def test_exceptions_inherit_from_base(exc_cls):
+    """Test every exception type is catchable as AysekaiError"""
+    error = exc_cls("test")
+
+    assert isinstance(error, AysekaiError)
+    assert isinstance(error, Exception)
+    assert str(error) == "test"
+
+
+@pytest.mark.parametrize(
+    "raised,other",
+    [
+        (ValidationError, DataError),
+        (DataError, ConfigurationError),
+        (ConfigurationError, ValidationError),
+    ],
+)
+def test_exception_types_stay_distinct(raised, other):
+    """Test sibling exception types do not catch each other"""
+    with pytest.raises(AysekaiError):
+        raise raised("test")
+
+    assert not issubclass(raised, other)
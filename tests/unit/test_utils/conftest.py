@@ -0,0 +1,41 @@
+"""Shared fixtures for aysekai.utils tests"""
+
+import pytest
+
+from aysekai.utils import csv_handler
+
+# Fixture CSV contents, interned once at import
+SAMPLE_CSV_HEADER = (
+    "Number,Arabic,Transliteration,Brief Meaning,"
+    "Level 1 - Shari'a,Level 2 - Tariqa,Level 3 - Haqiqa,Level 4 - Ma'rifa,"
+    "Quranic References,Dhikr Formulas,Pronunciation Guide\n"
+)
+SAMPLE_CSV_ROW = (
+    "1,الرحمن,Ar-Rahman,The Compassionate,"
+    "Legal meaning,Path meaning,Reality meaning,Gnosis meaning,"
+    "Surah Al-Fatiha (1:1),Yā Raḥmān,ar-rah-maan\n"
+)
+# Pre-encoded once so the fixture is a single write(2) with no codec work
+SAMPLE_CSV_BYTES = (SAMPLE_CSV_HEADER + SAMPLE_CSV_ROW).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def sample_names_csv(tmp_path_factory):
+    """Write the sample names CSV once per session and share it.
+
+    The file is only ever read by tests, so building it per test would
+    just repeat the same open/write/unlink syscalls.
+    """
+    path = tmp_path_factory.mktemp("csv") / "names.csv"
+    path.write_bytes(SAMPLE_CSV_BYTES)
+    return path
+
+
+@pytest.fixture(scope="module")
+def sample_reader(sample_names_csv):
+    """Reader bound to the shared sample CSV, built once per module.
+
+    AsmaCSVReader stats its path in __init__, so reusing one instance
+    across read-only tests avoids repeating that check per test.
+    """
+    return csv_handler.AsmaCSVReader(sample_names_csv)
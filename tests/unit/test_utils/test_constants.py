@@ -1,7 +1,31 @@
-"""Tests for asma_core.constants module"""
+"""Tests for aysekai.utils.constants module"""
 
 import pytest
-from asma_core import constants
+from aysekai.utils import constants
+
+
+# Expected values shared across tests, built once at import
+_EXPECTED_HEADERS = (
+    "The Beautiful Name / الاسم الحسن",
+    "Number / الرقم",
+    "Brief Meaning / المعنى المختصر",
+    "Ta'wil / التأويل",
+    "Quranic Reference / المرجع القرآني",
+    "Verse → Ayah / الآية",
+    "Dhikr Formula / صيغة الذكر",
+    "Pronunciation",
+    "Phonetics",
+)
+
+_EXPECTED_NOTION_NAMES = frozenset(
+    {
+        "Al-Bāqī (الباقي)",
+        "Al-Khabīr (الخبير)",
+        "Ar-Raqīb (الرقيب)",
+        "Al-Matīn (المتين)",
+        "Al-Mu'īd (المعيد)",
+    }
+)
 
 
 class TestColumnHeaders:
@@ -21,18 +45,7 @@ class TestColumnHeaders:
 
     def test_column_headers_content(self):
         """Test that COLUMN_HEADERS contains expected values"""
-        expected = [
-            "The Beautiful Name / الاسم الحسن",
-            "Number / الرقم",
-            "Brief Meaning / المعنى المختصر",
-            "Ta'wil / التأويل",
-            "Quranic Reference / المرجع القرآني",
-            "Verse → Ayah / الآية",
-            "Dhikr Formula / صيغة الذكر",
-            "Pronunciation",
-            "Phonetics",
-        ]
-        assert constants.COLUMN_HEADERS == expected
+        assert tuple(constants.COLUMN_HEADERS) == _EXPECTED_HEADERS
 
 
 class TestExistingNotionNames:
@@ -52,14 +65,7 @@ class TestExistingNotionNames:
 
     def test_existing_notion_names_content(self):
         """Test that EXISTING_NOTION_NAMES contains expected values"""
-        expected = {
-            "Al-Bāqī (الباقي)",
-            "Al-Khabīr (الخبير)",
-            "Ar-Raqīb (الرقيب)",
-            "Al-Matīn (المتين)",
-            "Al-Mu'īd (المعيد)",
-        }
-        assert constants.EXISTING_NOTION_NAMES == expected
+        assert constants.EXISTING_NOTION_NAMES == _EXPECTED_NOTION_NAMES
 
 
 class TestTawilLevels:
@@ -78,20 +84,18 @@ class TestTawilLevels:
         expected_keys = {"sharia", "tariqa", "haqiqa", "marifa"}
         assert set(constants.TAWIL_LEVELS.keys()) == expected_keys
 
-    def test_tawil_levels_structure(self):
-        """Test that each TAWIL_LEVEL has emoji and name"""
-        for level, data in constants.TAWIL_LEVELS.items():
-            assert "emoji" in data
-            assert "name" in data
-            assert isinstance(data["emoji"], str)
-            assert isinstance(data["name"], str)
-
-    def test_tawil_levels_values(self):
-        """Test specific TAWIL_LEVELS values"""
-        assert constants.TAWIL_LEVELS["sharia"] == {"emoji": "📿", "name": "SHARĪ'A"}
-        assert constants.TAWIL_LEVELS["tariqa"] == {"emoji": "🚶", "name": "ṬARĪQA"}
-        assert constants.TAWIL_LEVELS["haqiqa"] == {"emoji": "💎", "name": "ḤAQĪQA"}
-        assert constants.TAWIL_LEVELS["marifa"] == {"emoji": "🌟", "name": "MA'RIFA"}
+    @pytest.mark.parametrize(
+        "level,emoji,name",
+        [
+            ("sharia", "📿", "SHARĪ'A"),
+            ("tariqa", "🚶", "ṬARĪQA"),
+            ("haqiqa", "💎", "ḤAQĪQA"),
+            ("marifa", "🌟", "MA'RIFA"),
+        ],
+    )
+    def test_tawil_level(self, level, emoji, name):
+        """Test structure and values of each TAWIL_LEVELS entry"""
+        assert constants.TAWIL_LEVELS[level] == {"emoji": emoji, "name": name}
 
 
 class TestTawilPatterns:
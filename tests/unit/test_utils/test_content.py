@@ -1,16 +1,35 @@
-"""Tests for asma_core.content module"""
+"""Tests for aysekai.utils.content module"""
+
+import unicodedata
 
 import pytest
-from asma_core import content
+from aysekai.utils import content
+
+
+def _nfc(text):
+    """Normalize to NFC so diacritic (de)composition drift can't flake tests"""
+    return unicodedata.normalize("NFC", text)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "clean_multiline_content",
+        "process_tawil_sections",
+        "format_dhikr_content",
+        "normalize_arabic_text",
+        "remove_empty_lines",
+        "clean_quotes",
+    ],
+)
+def test_content_api(name):
+    """Test that the public content functions exist"""
+    assert hasattr(content, name)
 
 
 class TestCleanMultilineContent:
     """Test clean_multiline_content function"""
 
-    def test_function_exists(self):
-        """Test that clean_multiline_content function exists"""
-        assert hasattr(content, "clean_multiline_content")
-
     def test_remove_duplicate_quotes(self):
         """Test removal of duplicate quotes"""
         text = '""Hello World""'
@@ -50,10 +69,6 @@ class TestCleanMultilineContent:
 class TestProcessTawilSections:
     """Test process_tawil_sections function"""
 
-    def test_function_exists(self):
-        """Test that process_tawil_sections function exists"""
-        assert hasattr(content, "process_tawil_sections")
-
     def test_extract_sharia_section(self):
         """Test extraction of SHARĪ'A section"""
         text = "📿 SHARĪ'A: This is the sharī'a content 🚶 ṬARĪQA: Other content"
@@ -65,7 +80,7 @@ class TestProcessTawilSections:
         """Test extraction of all four Ta'wil sections"""
         text = """
         📿 SHARĪ'A: Legal meaning
-        🚶 ṬARĪQA: Path meaning  
+        🚶 ṬARĪQA: Path meaning
         💎 ḤAQĪQA: Reality meaning
         🌟 MA'RIFA: Gnosis meaning
         """
@@ -99,10 +114,6 @@ class TestProcessTawilSections:
 class TestFormatDhikrContent:
     """Test format_dhikr_content function"""
 
-    def test_function_exists(self):
-        """Test that format_dhikr_content function exists"""
-        assert hasattr(content, "format_dhikr_content")
-
     def test_basic_formatting(self):
         """Test basic Dhikr formula formatting"""
         text = "Yā Raḥmān (يا رحمن) - 100 times"
@@ -128,37 +139,29 @@ class TestFormatDhikrContent:
 class TestNormalizeArabicText:
     """Test normalize_arabic_text function"""
 
-    def test_function_exists(self):
-        """Test that normalize_arabic_text function exists"""
-        assert hasattr(content, "normalize_arabic_text")
-
     def test_basic_arabic_text(self):
         """Test basic Arabic text normalization"""
         text = "الرحمن"
         result = content.normalize_arabic_text(text)
-        assert result == "الرحمن"
+        assert _nfc(result) == _nfc("الرحمن")
 
     def test_mixed_arabic_english(self):
         """Test mixed Arabic and English text"""
         text = "Al-Rahman الرحمن The Compassionate"
         result = content.normalize_arabic_text(text)
         assert "Al-Rahman" in result
-        assert "الرحمن" in result
+        assert _nfc("الرحمن") in _nfc(result)
 
     def test_remove_extra_spaces(self):
         """Test removal of extra spaces around Arabic"""
         text = "  الله  "
         result = content.normalize_arabic_text(text)
-        assert result.strip() == "الله"
+        assert _nfc(result.strip()) == _nfc("الله")
 
 
 class TestRemoveEmptyLines:
     """Test remove_empty_lines function"""
 
-    def test_function_exists(self):
-        """Test that remove_empty_lines function exists"""
-        assert hasattr(content, "remove_empty_lines")
-
     def test_remove_empty_lines(self):
         """Test removal of empty lines"""
         text = "Line 1\n\n\nLine 2\n\n"
@@ -175,10 +178,6 @@ class TestRemoveEmptyLines:
 class TestCleanQuotes:
     """Test clean_quotes function"""
 
-    def test_function_exists(self):
-        """Test that clean_quotes function exists"""
-        assert hasattr(content, "clean_quotes")
-
     def test_smart_quotes_conversion(self):
         """Test conversion of smart quotes to regular quotes"""
         # Using unicode escapes for smart quotes
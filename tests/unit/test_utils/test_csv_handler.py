@@ -0,0 +1,95 @@
+"""Tests for aysekai.utils.csv_handler module"""
+
+import csv
+import io
+
+import pytest
+from pathlib import Path
+from aysekai.utils import csv_handler
+from aysekai.core.models import DivineName
+from aysekai.core.exceptions import DataError
+
+
+# The DivineName matching the sample fixture CSV, built once — tests
+# treat it as frozen data
+_SAMPLE_NAME = DivineName(
+    number=1,
+    arabic="الرحمن",
+    transliteration="Ar-Rahman",
+    brief_meaning="The Compassionate",
+    level_1_sharia="Legal meaning",
+    level_2_tariqa="Path meaning",
+    level_3_haqiqa="Reality meaning",
+    level_4_marifa="Gnosis meaning",
+    quranic_references="Surah Al-Fatiha (1:1)",
+    dhikr_formulas="Yā Raḥmān",
+    pronunciation_guide="ar-rah-maan",
+)
+
+
+@pytest.mark.parametrize(
+    "cls,method",
+    [
+        ("AsmaCSVReader", "read_all"),
+        ("AsmaCSVWriter", "write_all"),
+    ],
+)
+def test_csv_handler_api(cls, method):
+    """Test that the public csv_handler classes and methods exist"""
+    assert hasattr(csv_handler, cls)
+    assert hasattr(getattr(csv_handler, cls), method)
+
+
+class TestAsmaCSVReader:
+    """Test AsmaCSVReader class"""
+
+    def test_instantiation(self, sample_names_csv):
+        """Test that AsmaCSVReader can be instantiated"""
+        reader = csv_handler.AsmaCSVReader(sample_names_csv)
+        assert reader is not None
+
+    def test_read_all_with_valid_csv(self, sample_reader):
+        """Test reading names from valid CSV"""
+        names = sample_reader.read_all()
+
+        assert len(names) == 1
+        assert names[0].number == 1
+        assert names[0].arabic == "الرحمن"
+        assert names[0].transliteration == "Ar-Rahman"
+        assert names[0].brief_meaning == "The Compassionate"
+
+    def test_read_nonexistent_file_raises_error(self):
+        """Test that reading nonexistent file raises appropriate error"""
+        with pytest.raises(DataError):
+            csv_handler.AsmaCSVReader(Path("/nonexistent/file.csv"))
+
+
+class TestAsmaCSVWriter:
+    """Test AsmaCSVWriter class"""
+
+    def test_instantiation(self, tmp_path):
+        """Test that AsmaCSVWriter can be instantiated"""
+        writer = csv_handler.AsmaCSVWriter(tmp_path / "out.csv")
+        assert writer is not None
+
+    def test_write_all_output(self, tmp_path):
+        """Test written CSV contents without a disk round-trip"""
+        out_path = tmp_path / "out.csv"
+        writer = csv_handler.AsmaCSVWriter(out_path)
+        writer.write_all([_SAMPLE_NAME])
+
+        # Parse the written text in memory rather than re-reading through
+        # a second AsmaCSVReader (reading is covered by the reader tests)
+        rows = list(csv.reader(io.StringIO(out_path.read_text(encoding="utf-8"))))
+
+        assert len(rows) == 2  # header + 1 name
+        assert len(rows[0]) == 11  # 11 columns
+        assert rows[1][0] == "1"
+        assert rows[1][1] == "الرحمن"
+        assert rows[1][2] == "Ar-Rahman"
+
+    def test_write_all_creates_parent_dirs(self, tmp_path):
+        """Test that missing parent directories are created"""
+        out_path = tmp_path / "nested" / "dir" / "out.csv"
+        csv_handler.AsmaCSVWriter(out_path)
+        assert out_path.parent.exists()
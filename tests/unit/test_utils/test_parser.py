@@ -0,0 +1,174 @@
+"""Tests for aysekai.utils.parser module"""
+
+import unicodedata
+
+import pytest
+from aysekai.utils import parser
+
+
+# Quranic reference cases as a flat module-level table, built once at import.
+# Expected dicts hold the keys each variant must produce; an empty dict means
+# the parse must yield nothing at all.
+QURANIC_REFERENCE_CASES = (
+    (
+        "Surah Al-Baqarah (2:255)",  # standard reference
+        {"surah": "Al-Baqarah", "surah_number": 2, "verse": 255},
+    ),
+    (
+        "Surah Al-Fatiha (1:1-7)",  # verse range
+        {"surah": "Al-Fatiha", "surah_number": 1, "verse_start": 1, "verse_end": 7},
+    ),
+    (
+        "سورة البقرة (2:255)",  # Arabic surah name
+        {"surah_number": 2, "verse": 255},
+    ),
+    ("Not a reference", {}),  # invalid reference
+    ("", {}),  # empty input
+)
+
+# Known existing Notion names, shared across TestIsExistingName
+EXISTING_NAMES = [
+    "Al-Bāqī (الباقي)",
+    "Al-Khabīr (الخبير)",
+    "Ar-Raqīb (الرقيب)",
+    "Al-Matīn (المتين)",
+    "Al-Mu'īd (المعيد)",
+]
+
+# NFC forms precomputed once at import; lookups must not depend on the
+# composition form a caller happens to supply
+EXISTING_NAMES_NFC = tuple(unicodedata.normalize("NFC", n) for n in EXISTING_NAMES)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "parse_name_with_arabic",
+        "extract_name_number",
+        "is_existing_name",
+        "parse_quranic_reference",
+        "extract_name_from_line",
+    ],
+)
+def test_parser_api(name):
+    """Test that the public parser functions exist"""
+    assert hasattr(parser, name)
+
+
+class TestParseNameWithArabic:
+    """Test parse_name_with_arabic function"""
+
+    @pytest.mark.parametrize(
+        "text,transliteration,arabic",
+        [
+            ("Al-Rahman (الرحمن)", "Al-Rahman", "الرحمن"),  # standard format
+            (" Al-Rahman  ( الرحمن ) ", "Al-Rahman", "الرحمن"),  # extra spaces
+            ("Al-Rahman الرحمن", "Al-Rahman", "الرحمن"),  # no parentheses
+            ("الرحمن", "", "الرحمن"),  # Arabic only
+            ("Al-Rahman", "Al-Rahman", ""),  # English only
+            ("", "", ""),  # empty input
+            (None, "", ""),  # None input
+        ],
+    )
+    def test_parse_name(self, text, transliteration, arabic):
+        """Test parsing name variants into (transliteration, arabic)"""
+        assert parser.parse_name_with_arabic(text) == (transliteration, arabic)
+
+
+class TestExtractNameNumber:
+    """Test extract_name_number function"""
+
+    @pytest.mark.parametrize(
+        "text,number",
+        [
+            ("1. Al-Rahman", 1),  # simple number
+            ("(42) Al-Kabir", 42),  # number in parentheses
+            ("Name number 99 is Al-Sabur", 99),  # number in middle
+            ("Al-Rahman", None),  # no number
+            ("5. Name 10", 5),  # multiple numbers returns first
+            ("", None),  # empty input
+        ],
+    )
+    def test_extract_number(self, text, number):
+        """Test extracting the name number from text variants"""
+        assert parser.extract_name_number(text) == number
+
+
+class TestIsExistingName:
+    """Test is_existing_name function"""
+
+    def test_existing_name_exact_match(self):
+        """Test exact match of existing name"""
+        assert parser.is_existing_name("Al-Bāqī (الباقي)") is True
+
+    def test_existing_name_partial_match(self):
+        """Test partial match of existing name"""
+        assert parser.is_existing_name("Al-Bāqī") is True
+        assert parser.is_existing_name("الباقي") is True
+
+    def test_non_existing_name(self):
+        """Test non-existing name"""
+        assert parser.is_existing_name("Al-Rahman") is False
+
+    def test_case_sensitivity(self):
+        """Test case sensitivity"""
+        assert parser.is_existing_name("al-bāqī") is True  # Should be case-insensitive
+
+    def test_empty_input(self):
+        """Test with empty input"""
+        assert parser.is_existing_name("") is False
+
+    @pytest.mark.parametrize("name", EXISTING_NAMES)
+    def test_existing_name_known(self, name):
+        """Test each known existing name is recognized"""
+        assert parser.is_existing_name(name) is True
+
+    @pytest.mark.parametrize("name", EXISTING_NAMES_NFC)
+    def test_existing_name_nfc(self, name):
+        """Test NFC-normalized forms of known names are recognized"""
+        assert parser.is_existing_name(name) is True
+
+
+class TestParseQuranicReference:
+    """Test parse_quranic_reference function"""
+
+    @pytest.mark.parametrize("text,expected", QURANIC_REFERENCE_CASES)
+    def test_parse_reference(self, text, expected):
+        """Test parsing Quranic reference variants"""
+        result = parser.parse_quranic_reference(text)
+        if not expected:
+            assert result == {}
+        else:
+            for key, value in expected.items():
+                assert result[key] == value
+
+
+class TestExtractNameFromLine:
+    """Test extract_name_from_line function"""
+
+    def test_extract_numbered_name(self):
+        """Test extracting name from numbered line"""
+        line = "1. Al-Rahman (الرحمن) - The Compassionate"
+        name, number = parser.extract_name_from_line(line)
+        assert name == "Al-Rahman (الرحمن)"
+        assert number == 1
+
+    def test_extract_name_without_number(self):
+        """Test extracting name without number"""
+        line = "Al-Rahman (الرحمن) - The Compassionate"
+        name, number = parser.extract_name_from_line(line)
+        assert name == "Al-Rahman (الرحمن)"
+        assert number is None
+
+    def test_extract_name_with_complex_format(self):
+        """Test extracting name with complex format"""
+        line = "99 | Al-Sabur (الصبور) | The Patient One"
+        name, number = parser.extract_name_from_line(line)
+        assert name == "Al-Sabur (الصبور)"
+        assert number == 99
+
+    def test_empty_line(self):
+        """Test with empty line"""
+        name, number = parser.extract_name_from_line("")
+        assert name == ""
+        assert number is None
@@ -79,6 +79,17 @@ class TestInputValidator:
         emoji_text = "Hello 🌙 World 🕌"
         assert InputValidator.sanitize_prompt(emoji_text) == emoji_text
     
+    def test_sanitize_prompts_batch(self):
+        """Test batch prompt sanitization matches single-prompt results"""
+        prompts = ["Hello world", "  hello  ", None, '<b>Say "Hi"</b>']
+
+        results = InputValidator.sanitize_prompts(prompts)
+
+        assert results == [
+            InputValidator.sanitize_prompt(p) for p in prompts
+        ]
+        assert InputValidator.sanitize_prompts([]) == []
+
     def test_validate_number_input_valid(self):
         """Test valid number validation"""
         # Valid numbers
@@ -101,7 +112,29 @@ class TestInputValidator:
         assert InputValidator.validate_number_input("") is None
         assert InputValidator.validate_number_input(None) is None
         assert InputValidator.validate_number_input("12.5") is None
-    
+
+    def test_validate_number_batch(self):
+        """Test batch number validation"""
+        results = InputValidator.validate_number_batch(
+            ["1", "50", "99", "100", "abc", None, " 42 ", 7]
+        )
+
+        assert results == [1, 50, 99, None, None, None, 42, 7]
+
+    def test_validate_number_batch_empty(self):
+        """Test batch validation of empty input"""
+        assert InputValidator.validate_number_batch([]) == []
+
+    @pytest.mark.parametrize(
+        "value",
+        ["07", 7.0, True, "+5", " 42 ", "0", "100", "abc", "", None, 99],
+    )
+    def test_validate_number_batch_matches_single(self, value):
+        """Test batch and single validation agree on edge inputs"""
+        assert InputValidator.validate_number_batch([value]) == [
+            InputValidator.validate_number_input(value)
+        ]
+
     def test_validate_file_path_allowed(self):
         """Test file path validation for allowed paths"""
         allowed_dirs = ["/app/data", "/app/config"]
@@ -195,4 +228,16 @@ class TestInputValidator:
             sanitized = InputValidator.sanitize_prompt(injection)
             # Should not contain SQL keywords after sanitization
             assert "DROP" not in sanitized.upper()
-            assert "DELETE" not in sanitized.upper()
\ No newline at end of file
+            assert "DELETE" not in sanitized.upper()
+
+    def test_contains_sql_keyword(self):
+        """Test SQL keyword detection helper"""
+        # Keyword or comment marker present
+        assert InputValidator.contains_sql_keyword("DROP TABLE users") is True
+        assert InputValidator.contains_sql_keyword("select * from names") is True
+        assert InputValidator.contains_sql_keyword("admin'--") is True
+
+        # Clean text, including keyword substrings inside longer words
+        assert InputValidator.contains_sql_keyword("Hello world") is False
+        assert InputValidator.contains_sql_keyword("dropped the ball") is False
+        assert InputValidator.contains_sql_keyword("") is False
\ No newline at end of file